@@ -1,26 +1,217 @@
-from binance.client import Client
-import os
-
-# Replace these with your actual keys from the testnet page
-# api_key = os.environ.get('BINANCE_TESTNET_API_KEY')
-# api_secret = os.environ.get('BINANCE_TESTNET_SECRET_KEY')
-# print(os.environ.get('BINANCE_TESTNET_API_KEY'))
-# print(os.environ.get('BINANCE_TESTNET_SECRET_KEY'))
-
-api_key = os.environ.get('BINANCE_LIVE_API_KEY')
-api_secret = os.environ.get('BINANCE_LIVE_SECRET_KEY')
-print(os.environ.get('BINANCE_LIVE_API_KEY'))
-print(os.environ.get('BINANCE_LIVE_SECRET_KEY'))
-
-# The 'testnet=True' flag is crucial! It points the client to the testnet URL.
-client = Client(api_key, api_secret)
-
-# Make a simple API call to get account information
-account_info = client.get_account()
-# print("Account Balances:")
-# for balance in account_info['balances']:
-#     if float(balance['free']) > 0 or float(balance['locked']) > 0:
-#         print(f"  {balance['asset']}: Free = {balance['free']}, Locked = {balance['locked']}")
+# apiinfo.py
+from binance_client import get_account_client
+from concurrent.futures import ThreadPoolExecutor
+import argparse
+import time
+
+DEFAULT_ACCOUNT = 'live'
+DEFAULT_SYMBOLS = ['BTCUSDT']
+RECENT_FILLS = 5
+# Keeps the request burst well inside Binance rate limits (same IP as the live bot)
+MAX_WORKERS = 16
+
+# ======================
+# Concurrent Queries
+# ======================
+def timed(func, *args, **kwargs):
+    """Runs func and returns (result, error, seconds)."""
+    start = time.perf_counter()
+    try:
+        return func(*args, **kwargs), None, time.perf_counter() - start
+    except Exception as e:
+        return None, e, time.perf_counter() - start
+
+
+def take_snapshot(accounts, symbols, fills=RECENT_FILLS):
+    """
+    Fetches balances, open orders and recent fills for every account/symbol
+    pair concurrently, plus exchange info once per environment (testnet/live).
+    Returns (clients, results, wall_seconds) where results maps
+    (account or environment, query, symbol) -> (result, error, seconds).
+    """
+    queries_per_account = 1 + 2 * len(symbols)
+    pool_size = min(MAX_WORKERS, queries_per_account + 1)
+    start = time.perf_counter()
+
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as pool:
+        # 1. Connect every account in parallel
+        clients, results = {}, {}
+        futures = {a: pool.submit(timed, get_account_client, a, pool_size=pool_size) for a in accounts}
+        for account, future in futures.items():
+            client, error, seconds = future.result()
+            results[(account, 'connect', None)] = (client, error, seconds)
+            if client is not None:
+                clients[account] = client
+
+        # 2. Fire every query (the pool caps how many run at once)
+        futures = {}
+        environments = {}
+        for account, client in clients.items():
+            environments.setdefault(environment(client), client)
+            futures[(account, 'balances', None)] = pool.submit(timed, client.get_account)
+            for symbol in symbols:
+                futures[(account, 'open_orders', symbol)] = pool.submit(
+                    timed, client.get_open_orders, symbol=symbol)
+                futures[(account, 'fills', symbol)] = pool.submit(
+                    timed, client.get_my_trades, symbol=symbol, limit=fills)
+        # Exchange info is public: one request per environment covers every symbol
+        for env, client in environments.items():
+            futures[(env, 'exchange_info', None)] = pool.submit(timed, client.get_exchange_info)
+
+        for key, future in futures.items():
+            results[key] = future.result()
+
+    return clients, results, time.perf_counter() - start
+
+
+def environment(client):
+    """'testnet' or 'live', the exchange a client talks to."""
+    return 'testnet' if getattr(client, 'testnet', False) else 'live'
+
+
+# ======================
+# Report
+# ======================
+def format_filters(info):
+    """Compact tick size / step size / min notional summary."""
+    parts = []
+    for f in info.get('filters', []):
+        if f['filterType'] == 'PRICE_FILTER':
+            parts.append(f"tick={f['tickSize']}")
+        elif f['filterType'] == 'LOT_SIZE':
+            parts.append(f"step={f['stepSize']} minQty={f['minQty']}")
+        elif f['filterType'] in ('MIN_NOTIONAL', 'NOTIONAL'):
+            parts.append(f"minNotional={f.get('minNotional', '')}")
+    return ", ".join(parts)
+
+
+def print_report(accounts, symbols, results, wall):
+    """Renders the whole snapshot in one pass."""
+    def err(key):
+        return f"✗ {results[key][1]}"
+
+    # Symbol info by environment, looked up locally from one exchange info each
+    symbol_info = {}
+    for (env, query, _), (info, error, _) in results.items():
+        if query == 'exchange_info' and info:
+            symbol_info[env] = {s['symbol']: s for s in info['symbols']}
+
+    # Assets worth showing even when zero (base/quote of each symbol)
+    assets = set()
+    for infos in symbol_info.values():
+        for symbol in symbols:
+            if symbol in infos:
+                assets.update([infos[symbol]['baseAsset'], infos[symbol]['quoteAsset']])
+
+    for env in ('live', 'testnet'):
+        key = (env, 'exchange_info', None)
+        if key not in results:
+            continue
+        print("\n" + "=" * 80)
+        print(f"EXCHANGE FILTERS ({env})")
+        print("=" * 80)
+        if results[key][1]:
+            print(f"  {err(key)}")
+            continue
+        for symbol in symbols:
+            info = symbol_info[env].get(symbol)
+            if not info:
+                print(f"  {symbol}: unknown symbol")
+            else:
+                print(f"  {symbol} [{info['status']}]: {format_filters(info)}")
+
+    for account in accounts:
+        print("\n" + "=" * 80)
+        client, error, _ = results[(account, 'connect', None)]
+        print(f"ACCOUNT: {account}" + ("" if error else f" ({environment(client)})"))
+        print("=" * 80)
+        if error:
+            print(f"  {err((account, 'connect', None))}")
+            continue
+
+        key = (account, 'balances', None)
+        if results[key][1]:
+            print(f"  Balances: {err(key)}")
+        else:
+            print("  Balances:")
+            for balance in results[key][0]['balances']:
+                free_balance = float(balance['free'])
+                locked_balance = float(balance['locked'])
+                if balance['asset'] in assets or free_balance > 0 or locked_balance > 0:
+                    print(f"    {balance['asset']}: Free = {free_balance:.8f}, Locked = {locked_balance:.8f}")
+
+        for symbol in symbols:
+            key = (account, 'open_orders', symbol)
+            if results[key][1]:
+                print(f"  {symbol} open orders: {err(key)}")
+            else:
+                orders = results[key][0]
+                print(f"  {symbol} open orders: {len(orders)}")
+                for o in orders:
+                    print(f"    #{o['orderId']} {o['side']} {o['type']} qty={o['origQty']} "
+                          f"price={o['price']} stop={o.get('stopPrice', '')}")
+
+            key = (account, 'fills', symbol)
+            if results[key][1]:
+                print(f"  {symbol} recent fills: {err(key)}")
+            else:
+                trades = results[key][0]
+                print(f"  {symbol} recent fills: {len(trades)}")
+                for t in trades:
+                    when = time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(t['time'] / 1000))
+                    side = 'BUY' if t['isBuyer'] else 'SELL'
+                    print(f"    {when} {side} {t['qty']} @ {t['price']} (order #{t['orderId']})")
+
+    print("\n" + "=" * 80)
+    print("QUERY TIMINGS")
+    print("=" * 80)
+    for (account, query, symbol), (_, error, seconds) in sorted(
+            results.items(), key=lambda item: -item[1][2]):
+        status = "✗" if error else "✓"
+        print(f"  {status} {seconds * 1000:8.1f} ms  {account or '-':<10} {query:<12} {symbol or ''}")
+    slowest = max((r[2] for r in results.values()), default=0)
+    print(f"\nTotal: {len(results)} queries in {wall:.2f}s (slowest single query {slowest:.2f}s)")
+
+
+def cancel_all_orders(symbol, account=DEFAULT_ACCOUNT):
+    """Cancel all open orders for a given symbol."""
+    try:
+        client = get_account_client(account)
+        open_orders = client.get_open_orders(symbol=symbol)
+        if not open_orders:
+            print(f"No open orders for {symbol}")
+            return []
+
+        cancelled = []
+        for order in open_orders:
+            order_id = order["orderId"]
+            client.cancel_order(symbol=symbol, orderId=order_id)
+            cancelled.append(order_id)
+            print(f"✓ Cancelled order {order_id} for {symbol}")
+
+        return cancelled
+    except Exception as e:
+        print(f"✗ Error cancelling orders: {e}")
+        return None
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Snapshot balances, open orders, fills and filters.")
+    parser.add_argument("--accounts", nargs="+", default=[DEFAULT_ACCOUNT],
+                        help="testnet, live, or NAME with BINANCE_<NAME>_API_KEY/_SECRET_KEY set")
+    parser.add_argument("--symbols", nargs="+", default=DEFAULT_SYMBOLS)
+    parser.add_argument("--fills", type=int, default=RECENT_FILLS, help="recent fills per symbol")
+    args = parser.parse_args()
+
+    symbols = [s.upper() for s in args.symbols]
+    clients, results, wall = take_snapshot(args.accounts, symbols, fills=args.fills)
+    print_report(args.accounts, symbols, results, wall)
+
+# ======================
+# Handy one-off calls
+# ======================
+# from binance.client import Client
+# client = get_account_client('testnet')
 
 # order_book = client.get_order_book(symbol='BTCUSDT')
 # print(order_book)
@@ -46,45 +237,15 @@ account_info = client.get_account()
 #                 quantity=0.1,
 #                 price="108900")
 
-
 # Cancel an order using its ID
 # cancel_order = client.cancel_order(symbol='BTCUSDT', orderId=17788655)
 # print(cancel_order)
 
-def cancel_all_orders(symbol):
-    """Cancel all open orders for a given symbol."""
-    try:
-        open_orders = client.get_open_orders(symbol=symbol)
-        if not open_orders:
-            print(f"No open orders for {symbol}")
-            return []
-
-        cancelled = []
-        for order in open_orders:
-            order_id = order["orderId"]
-            client.cancel_order(symbol=symbol, orderId=order_id)
-            cancelled.append(order_id)
-            print(f"✓ Cancelled order {order_id} for {symbol}")
-
-        return cancelled
-    except Exception as e:
-        print(f"✗ Error cancelling orders: {e}")
-        return None
 # print(cancel_all_orders('BTCUSDT'))
 
 # order = client.order_market_sell(symbol= 'BTCUSDT',quantity = 0.9199)
 # print(f"Market sell order placed successfully: {order}")
 
-# Filter for only BTC and USDT
-target_assets = ['BTC', 'USDT']
-for balance in account_info['balances']:
-    if balance['asset'] in target_assets:
-        free_balance = float(balance['free'])
-        locked_balance = float(balance['locked'])
-        
-        # Print regardless of whether the balance is zero or not
-        print(f"  {balance['asset']}: Free = {free_balance:.8f}, Locked = {locked_balance:.8f}")
-
 # order = client.create_order(
 #     symbol="BTCUSDT",
 #     side="BUY",
@@ -112,7 +273,3 @@ for balance in account_info['balances']:
 #     quantity=1,
 #     stopPrice="109100"  # trigger when price hits 26k
 # )
-open_orders = client.get_open_orders(symbol='BTCUSDT')
-print(open_orders)
-
-
@@ -2,13 +2,27 @@
 from binance.client import Client
 import pandas as pd
 import requests
+from requests.adapters import HTTPAdapter
 import os
 import time
 import random
+import atexit
+from recorder import CaptureWriter, RecordingClient
 
 # Change this to False if you are trading live account
 TESTNET = True
 
+# Set BINANCE_CAPTURE_FILE (e.g. capture.jsonl.gz) to record all exchange traffic for replay.py
+CAPTURE_FILE = os.environ.get('BINANCE_CAPTURE_FILE')
+_capture = CaptureWriter(CAPTURE_FILE) if CAPTURE_FILE else None
+if _capture:
+    atexit.register(_capture.close)
+
+def record_tick():
+    """Marks the start of one executor run in the capture (no-op when not recording)."""
+    if _capture:
+        _capture.write("tick")
+
 # ======================
 # Retry Wrapper
 # ======================
@@ -55,19 +69,54 @@ def get_binance_client(testnet=TESTNET):
         api_key = os.environ.get('BINANCE_LIVE_API_KEY')
         api_secret = os.environ.get('BINANCE_LIVE_SECRET_KEY')
 
+    return _make_client(api_key, api_secret, testnet)
+
+
+def get_account_client(account, pool_size=None):
+    """
+    Creates a Client for a named account, reading BINANCE_<NAME>_API_KEY and
+    BINANCE_<NAME>_SECRET_KEY. 'testnet' uses the testnet endpoint, anything
+    else (e.g. 'live') the live one.
+    - pool_size: keep-alive connections per host, for concurrent callers
+    """
+    prefix = account.upper()
+    api_key = os.environ.get(f'BINANCE_{prefix}_API_KEY')
+    api_secret = os.environ.get(f'BINANCE_{prefix}_SECRET_KEY')
+    return _make_client(api_key, api_secret, testnet=(prefix == 'TESTNET'), pool_size=pool_size)
+
+
+class PooledClient(Client):
+    """Client whose session is sized for concurrent requests from the first (ping) request on."""
+
+    def __init__(self, *args, pool_size=10, **kwargs):
+        self.pool_size = pool_size
+        super().__init__(*args, **kwargs)
+
+    def _init_session(self):
+        session = super()._init_session()
+        session.mount('https://', HTTPAdapter(pool_maxsize=self.pool_size))
+        return session
+
+
+def _make_client(api_key, api_secret, testnet, pool_size=None):
     if not api_key or not api_secret:
         raise ValueError("Missing Binance API keys in environment variables.")
 
-    return Client(api_key, api_secret, testnet=testnet)
+    if pool_size:
+        client = PooledClient(api_key, api_secret, testnet=testnet, pool_size=pool_size)
+    else:
+        client = Client(api_key, api_secret, testnet=testnet)
+    if _capture:
+        client = RecordingClient(client, _capture)
+    return client
 
 
 # ======================
 # Live Kline Fetcher
 # ======================
-def fetch_live_klines(symbol, interval, limit=500, api_key_live=None):
+def get_raw_klines(symbol, interval, limit=500, api_key_live=None):
     """
-    Fetches live kline (OHLCV) data from Binance using a live account API key
-    and returns a cleaned pandas DataFrame.
+    Fetches raw kline rows from Binance REST API (recorded when capturing).
     """
     url = "https://api.binance.com/api/v3/klines"
     params = {
@@ -80,9 +129,30 @@ def fetch_live_klines(symbol, interval, limit=500, api_key_live=None):
         headers["X-MBX-APIKEY"] = api_key_live
 
     # wrap the GET call with safe_api_call
-    response = safe_api_call(requests.get, url, headers=headers, params=params)
-    response.raise_for_status()
-    klines = response.json()
+    start = time.time()
+    try:
+        response = safe_api_call(requests.get, url, headers=headers, params=params)
+        response.raise_for_status()
+        klines = response.json()
+    except Exception as e:
+        # Failed fetches are recorded too, so replay keeps every tick's klines in step
+        if _capture:
+            _capture.write("error", method="klines", url=url, params=params,
+                           error=type(e).__name__, message=str(e),
+                           code=getattr(e, "code", None), elapsed=time.time() - start)
+        raise
+    if _capture:
+        _capture.write("http", method="GET", url=url, params=params,
+                       result=klines, elapsed=time.time() - start)
+    return klines
+
+
+def fetch_live_klines(symbol, interval, limit=500, api_key_live=None):
+    """
+    Fetches live kline (OHLCV) data from Binance using a live account API key
+    and returns a cleaned pandas DataFrame.
+    """
+    klines = get_raw_klines(symbol, interval, limit=limit, api_key_live=api_key_live)
 
     # Create DataFrame
     columns = [
@@ -0,0 +1,217 @@
+# candle_aggregator.py
+from collections import deque
+import pandas as pd
+
+# Binance kline intervals that can be built from 1m candles
+UNIT_MS = {'m': 60_000, 'h': 3_600_000, 'd': 86_400_000, 'w': 604_800_000}
+MINUTE_MS = UNIT_MS['m']
+# Most 1m candles Binance returns from one klines request
+MAX_KLINES_LIMIT = 1000
+# Unix epoch was a Thursday, Binance weekly candles open on Monday 00:00 UTC
+WEEK_OFFSET_MS = 4 * UNIT_MS['d']
+
+
+def interval_to_ms(interval):
+    """Converts a Binance interval string ('3m', '1h', '1d', '1w') to milliseconds."""
+    unit = interval[-1]
+    if unit not in UNIT_MS or not interval[:-1].isdigit():
+        raise ValueError(f"Unsupported interval for 1m aggregation: {interval}")
+    return int(interval[:-1]) * UNIT_MS[unit]
+
+
+def _merge(bar, candle):
+    """Returns bar extended with a later candle (either may be None)."""
+    if bar is None:
+        return dict(candle)
+    if candle is None:
+        return dict(bar)
+    return {
+        'open': bar['open'],
+        'high': max(bar['high'], candle['high']),
+        'low': min(bar['low'], candle['low']),
+        'close': candle['close'],
+        'volume': bar['volume'] + candle['volume'],
+    }
+
+
+# ======================
+# Sliding Channel Window
+# ======================
+class _ChannelWindow:
+    """Max high / min low of the last `length` completed bars in O(1) amortized."""
+
+    def __init__(self, length):
+        self.length = length
+        self.count = 0
+        self.highs = deque()  # (index, high), decreasing
+        self.lows = deque()   # (index, low), increasing
+
+    def push(self, high, low):
+        i = self.count
+        self.count += 1
+        while self.highs and self.highs[-1][1] <= high:
+            self.highs.pop()
+        self.highs.append((i, high))
+        while self.lows and self.lows[-1][1] >= low:
+            self.lows.pop()
+        self.lows.append((i, low))
+        while self.highs[0][0] <= i - self.length:
+            self.highs.popleft()
+        while self.lows[0][0] <= i - self.length:
+            self.lows.popleft()
+
+    def bounds(self):
+        if not self.highs:
+            return None, None
+        return self.highs[0][1], self.lows[0][1]
+
+
+# ======================
+# Single Timeframe
+# ======================
+class _Timeframe:
+    def __init__(self, interval, length, history):
+        self.interval = interval
+        self.ms = interval_to_ms(interval)
+        self.offset = WEEK_OFFSET_MS if interval.endswith('w') else 0
+        self.window = _ChannelWindow(length)
+        self.history = deque(maxlen=history)
+        self.start = None      # open time (ms) of the bar being built
+        self.closed = None     # merge of its finished 1m candles
+        self.minutes = 0       # 1m candles seen in it (including the live one)
+        self.up_bound, self.down_bound = None, None
+
+    def bucket(self, open_time):
+        return open_time - (open_time - self.offset) % self.ms
+
+    def fold(self, live):
+        """Adds the finished live 1m candle to the bar being built."""
+        self.closed = _merge(self.closed, live)
+
+    def complete(self):
+        """
+        True once every 1m candle of the bar has been seen. Bars that started
+        before the first candle (warmup) or that span a gap stay incomplete.
+        """
+        return self.minutes * MINUTE_MS >= self.ms
+
+    def roll(self, open_time):
+        """Starts a new bar if open_time belongs to the next interval."""
+        start = self.bucket(open_time)
+        if start == self.start:
+            self.minutes += 1
+            return
+        if self.start is not None and self.closed is not None:
+            bar = dict(self.closed, timestamp=self.start, upBound=self.up_bound,
+                       downBound=self.down_bound, complete=self.complete())
+            self.history.append(bar)
+            # Partial bars would understate the channel, keep them out of it
+            if bar['complete']:
+                self.window.push(bar['high'], bar['low'])
+                self.up_bound, self.down_bound = self.window.bounds()
+        self.start = start
+        self.closed = None
+        self.minutes = 1
+
+    def current(self, live):
+        # Its last 1m candle is still forming, so the bar is never final yet
+        bar = _merge(self.closed, live)
+        bar.update(timestamp=self.start, upBound=self.up_bound, downBound=self.down_bound,
+                   complete=False)
+        return bar
+
+
+# ======================
+# Candle Aggregator
+# ======================
+class CandleAggregator:
+    """
+    Builds higher-timeframe candles locally from a single 1m feed.
+    - Bars are aligned to Binance boundaries (UTC, weeks start Monday).
+    - The forming 1m candle can be fed again as it updates; it replaces itself.
+    - Older 1m candles (overlapping fetches) are ignored, so feeding the last
+      few rows of every fetch is safe.
+    - Missing 1m candles leave the affected bars marked incomplete.
+    - Each 1m candle costs O(1) per timeframe, no extra API requests.
+    """
+
+    def __init__(self, timeframes=('3m', '5m', '15m', '1h'), length=1, history=500):
+        self.length = length
+        self.timeframes = {tf: _Timeframe(tf, length, history) for tf in timeframes}
+        self.live_time = None
+        self.live = None
+        self.gaps = 0
+        if self.warmup_limit() > MAX_KLINES_LIMIT:
+            print(f"⚠ Timeframes {list(timeframes)} need {self.warmup_limit()} 1m candles to warm up, "
+                  f"more than one request returns ({MAX_KLINES_LIMIT}). "
+                  f"Their channel bounds stay empty until enough bars complete live.")
+
+    def warmup_limit(self):
+        """1m candles needed so every timeframe has `length` completed bars."""
+        if not self.timeframes:
+            return 1
+        longest = max(tf.ms for tf in self.timeframes.values())
+        return (longest // MINUTE_MS) * (self.length + 1)
+
+    def update(self, open_time, open, high, low, close, volume):
+        """Feeds one 1m candle (open_time in ms). Returns False if it was stale."""
+        open_time = int(open_time)
+        if self.live_time is not None and open_time < self.live_time:
+            return False
+        candle = {'open': float(open), 'high': float(high), 'low': float(low),
+                  'close': float(close), 'volume': float(volume)}
+        if self.live_time is not None and open_time > self.live_time + MINUTE_MS:
+            self.gaps += 1
+            missing = (open_time - self.live_time) // MINUTE_MS - 1
+            print(f"⚠ Missing {missing} 1m candle(s) before {open_time}, affected bars marked incomplete.")
+        if open_time != self.live_time:
+            for tf in self.timeframes.values():
+                if self.live is not None:
+                    tf.fold(self.live)
+                tf.roll(open_time)
+            self.live_time = open_time
+        self.live = candle
+        return True
+
+    def update_klines(self, klines):
+        """Feeds raw Binance kline rows (as returned by get_raw_klines)."""
+        for k in klines:
+            self.update(k[0], k[1], k[2], k[3], k[4], k[5])
+
+    def update_frame(self, df):
+        """Feeds a fetch_live_klines DataFrame."""
+        for row in df.itertuples(index=False):
+            self.update(int(row.timestamp.timestamp() * 1000),
+                        row.open, row.high, row.low, row.close, row.volume)
+
+    def current(self, interval):
+        """
+        The bar being built for interval. Always complete=False: it only becomes
+        final (and complete if no 1m candle is missing) once the next bar starts.
+        """
+        tf = self.timeframes[interval]
+        if tf.start is None:
+            return None
+        return tf.current(self.live)
+
+    def bounds(self, interval):
+        """(upBound, downBound) channel for interval, None until a bar has completed."""
+        tf = self.timeframes[interval]
+        return tf.up_bound, tf.down_bound
+
+    def frame(self, interval):
+        """
+        Finished bars plus the current (forming, complete=False) one, in the same
+        shape as fetch_live_klines output with an extra 'complete' column.
+        """
+        tf = self.timeframes[interval]
+        rows = list(tf.history)
+        if tf.start is not None:
+            rows.append(tf.current(self.live))
+        columns = ['timestamp', 'open', 'high', 'low', 'close', 'volume', 'upBound', 'downBound',
+                   'complete']
+        df = pd.DataFrame(rows, columns=columns)
+        df['timestamp'] = pd.to_datetime(df['timestamp'], unit='ms') \
+                            .dt.tz_localize('UTC') \
+                            .dt.tz_convert('Asia/Karachi')
+        return df
@@ -1,5 +1,6 @@
 # executor_limit.py
-from binance_client import get_binance_client, fetch_live_klines
+from binance_client import get_binance_client, fetch_live_klines, record_tick
+from candle_aggregator import CandleAggregator, MAX_KLINES_LIMIT, MINUTE_MS
 import risk_management
 import time
 import csv
@@ -10,9 +11,11 @@ import os
 SYMBOL = 'BTCUSDT'
 TIMEFRAME = '1m'
 LENGTH = 1  # channel length
+HIGHER_TIMEFRAMES = ['3m', '5m', '15m', '1h']  # built locally from the 1m candles
 LOG_FILE = "trade_log.csv"
 
 client = get_binance_client()
+aggregator = CandleAggregator(HIGHER_TIMEFRAMES, length=LENGTH)
 
 # ----------------- Logger -----------------
 def log_trade(order, side=None, stop_price=None, quantity=None):
@@ -153,6 +156,7 @@ def place_stop_order(side, quantity, stop_price):
 def execute_strategy_limit():
     """Main limit-order executor."""
     print(f"\n--- Checking at {time.strftime('%Y-%m-%d %H:%M:%S')} ---")
+    record_tick()
     
     # 1. Check position
     position_size, current_side = get_open_position()
@@ -160,7 +164,15 @@ def execute_strategy_limit():
 
     # 2. Fetch candle data
     try:
-        data = fetch_live_klines(SYMBOL, TIMEFRAME, limit=5)  # last candle
+        # first run fetches enough history to warm up the higher timeframes,
+        # later runs everything since the last candle seen (so pauses leave no gaps)
+        if aggregator.live_time:
+            needed = (int(time.time() * 1000) - aggregator.live_time) // MINUTE_MS + 2
+        else:
+            needed = aggregator.warmup_limit()
+        limit = min(max(needed, 5), MAX_KLINES_LIMIT)
+        data = fetch_live_klines(SYMBOL, TIMEFRAME, limit=limit)  # last candle
+        aggregator.update_frame(data)
         candle = data.tail(1)
         upbound = float(candle['upBound'].values[0])  
         downbound = float(candle['downBound'].values[0]) 
@@ -0,0 +1,152 @@
+# recorder.py
+import json
+import os
+import threading
+import time
+import zlib
+
+GZIP_MAGIC = b"\x1f\x8b\x08"
+GZIP_WBITS = 31  # zlib wbits for a gzip header/trailer
+READ_CHUNK = 4096
+
+# ======================
+# Capture Writer
+# ======================
+class CaptureWriter:
+    """
+    Append-only, gzip-compressed capture of exchange traffic.
+    Every record is one JSON line with a wall-clock timestamp ("ts") and the
+    id of the writing process ("session"), so traffic from other tools sharing
+    the file can be told apart from the bot's.
+    - kind: 'call' (request + response), 'error' (request + exception),
+            'http' (raw REST GET), 'stream' (websocket message), 'tick' (executor run)
+    Each session appends one gzip member, sync-flushed after every record: records
+    share one compression dictionary, yet everything written before a crash stays
+    readable and a restart simply appends a new member.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self.session = f"{os.getpid()}-{int(time.time() * 1000)}"
+        self._file = open(path, mode="ab")
+        self._deflate = zlib.compressobj(zlib.Z_DEFAULT_COMPRESSION, zlib.DEFLATED, GZIP_WBITS)
+        # The recording client is shared by threads (e.g. apiinfo.py snapshots)
+        self._lock = threading.Lock()
+
+    def write(self, kind, **fields):
+        record = {"ts": time.time(), "kind": kind, "session": self.session}
+        record.update(fields)
+        with self._lock:
+            if self._file.closed:
+                return
+            line = json.dumps(record, default=str) + "\n"
+            self._file.write(self._deflate.compress(line.encode("utf-8"))
+                             + self._deflate.flush(zlib.Z_SYNC_FLUSH))
+            self._file.flush()
+
+    def record_stream(self, stream, message):
+        """Records a single stream (websocket) message."""
+        self.write("stream", stream=stream, message=message)
+
+    def close(self):
+        """Finishes this session's gzip member (safe to call twice)."""
+        with self._lock:
+            if self._file.closed:
+                return
+            self._file.write(self._deflate.flush(zlib.Z_FINISH))
+            self._file.close()
+
+
+def read_capture(path):
+    """
+    Yields records from a capture file in the order they were written.
+    A member left open by a crash (or a bot still running) yields every record
+    that was flushed; corrupt data is skipped with a warning and reading resumes
+    at the next gzip member.
+    """
+    with open(path, mode="rb") as f:
+        data = memoryview(f.read())
+
+    pos, count = 0, 0
+    while pos < len(data):
+        d = zlib.decompressobj(wbits=GZIP_WBITS)
+        pending, i, error = b"", pos, None
+        while not d.eof and i < len(data) and error is None:
+            chunk = data[i:i + READ_CHUNK]
+            backup = d.copy()
+            try:
+                out = d.decompress(chunk)
+                i += len(chunk)
+            except zlib.error as e:
+                # Feed the chunk byte by byte to keep what decodes before the bad byte
+                d, out, error = backup, b"", e
+                for n in range(len(chunk)):
+                    try:
+                        out += d.decompress(chunk[n:n + 1])
+                    except zlib.error:
+                        break
+                i += n
+            lines = (pending + out).split(b"\n")
+            pending = lines.pop()
+            for line in lines:
+                if not line.strip():
+                    continue
+                try:
+                    record = json.loads(line)
+                except (json.JSONDecodeError, UnicodeDecodeError):
+                    print(f"⚠ Skipping unreadable capture record after {count} records.")
+                    continue
+                count += 1
+                yield record
+
+        if d.eof:
+            pos = i - len(d.unused_data)
+            continue
+
+        # Unfinished member: crash, bot still running, or corrupt bytes
+        search_from = max(pos + 1, i - len(GZIP_MAGIC))
+        following = bytes(data[search_from:]).find(GZIP_MAGIC)
+        reason = error or "session not closed (crashed or still running)"
+        print(f"⚠ Capture member at byte {pos} ended early after {count} records ({reason}), "
+              + ("skipping ahead." if following != -1 else "end of file."))
+        if following == -1:
+            return
+        pos = search_from + following
+
+
+# ======================
+# Recording Client
+# ======================
+class RecordingClient:
+    """
+    Wraps a binance Client and records every method call with its
+    arguments, result (or exception) and round-trip time.
+    """
+
+    def __init__(self, client, writer):
+        self._client = client
+        self._writer = writer
+
+    def __getattr__(self, name):
+        attr = getattr(self._client, name)
+        if not callable(attr):
+            return attr
+
+        def recorded(*args, **kwargs):
+            start = time.time()
+            try:
+                result = attr(*args, **kwargs)
+            except Exception as e:
+                self._writer.write(
+                    "error", method=name, args=list(args), kwargs=kwargs,
+                    error=type(e).__name__, message=str(e),
+                    code=getattr(e, "code", None), elapsed=time.time() - start,
+                )
+                raise
+            self._writer.write(
+                "call", method=name, args=list(args), kwargs=kwargs,
+                result=result, elapsed=time.time() - start,
+            )
+            return result
+
+        return recorded
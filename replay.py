@@ -0,0 +1,243 @@
+# replay.py
+import argparse
+import cProfile
+import pstats
+import time
+from collections import defaultdict, deque
+from datetime import datetime
+
+import binance_client
+from recorder import read_capture
+
+REPLAY_LOG_FILE = "replay_trade_log.csv"
+
+# ======================
+# Replay Session
+# ======================
+class ReplayedAPIError(Exception):
+    """Re-raised exception recorded in the capture (same message and code)."""
+
+    def __init__(self, message, code=None, error=None):
+        super().__init__(message)
+        self.message = message
+        self.code = code
+        self.error = error
+
+    def __str__(self):
+        return self.message
+
+
+class ReplayExhausted(Exception):
+    """Executor asked for more traffic than the capture contains."""
+
+
+class ReplaySession:
+    """
+    Serves recorded responses back tick by tick.
+    Records are grouped under the executor tick that preceded them in the same
+    session (process), and each replayed run only sees its own tick's records:
+    a run that makes more or fewer calls than the recorded one is reported and
+    never shifts responses into the next tick. Records from sessions without
+    ticks (e.g. apiinfo.py sharing the capture file) are skipped.
+    """
+
+    def __init__(self, records):
+        self.ticks = []
+        self.skipped = 0
+        current = {}  # session -> its latest tick
+        for record in records:
+            kind = record["kind"]
+            session = record.get("session")
+            if kind == "tick":
+                current[session] = {"ts": record["ts"], "queues": defaultdict(deque)}
+                self.ticks.append(current[session])
+            elif kind in ("call", "error", "http"):
+                if session not in current:
+                    self.skipped += 1
+                    continue
+                # failed klines fetches are 'error' records with method 'klines'
+                method = "klines" if kind == "http" else record["method"]
+                current[session]["queues"][method].append(record)
+        self.ticks.sort(key=lambda tick: tick["ts"])
+        self.queues = defaultdict(deque)
+        self.now = self.ticks[0]["ts"] if self.ticks else time.time()
+        self.served = 0
+        self.mismatches = []
+        self.calls = defaultdict(int)
+        self.missing = []   # (tick number, method) asked for but not recorded
+        self.leftover = []  # (tick number, {method: count}) recorded but not asked for
+        self.tick_number = 0
+
+    def begin_tick(self, number):
+        """Serves only the records of tick `number` from now on."""
+        tick = self.ticks[number]
+        self.tick_number = number
+        self.now = tick["ts"]
+        self.queues = tick["queues"]
+
+    def end_tick(self):
+        unused = {method: len(q) for method, q in self.queues.items() if q}
+        if unused:
+            self.leftover.append((self.tick_number, unused))
+
+    def _next(self, method, args=None, kwargs=None):
+        queue = self.queues[method]
+        if not queue:
+            self.missing.append((self.tick_number, method))
+            raise ReplayExhausted(f"No recorded response left for {method} in tick {self.tick_number}")
+        record = queue.popleft()
+        self.served += 1
+        self.calls[method] += 1
+        if args is not None and (record.get("args", []) != _jsonable(list(args))
+                                 or record.get("kwargs", {}) != _jsonable(kwargs)):
+            self.mismatches.append((method, record.get("args"), record.get("kwargs"),
+                                    list(args), kwargs))
+        if record["kind"] == "error":
+            raise ReplayedAPIError(record["message"], record.get("code"), record.get("error"))
+        return record["result"]
+
+    def get_raw_klines(self, symbol, interval, limit=500, api_key_live=None):
+        params = {"symbol": symbol.upper(), "interval": interval, "limit": limit}
+        record = self.queues["klines"][0] if self.queues["klines"] else None
+        if record is not None and record.get("params") != params:
+            self.mismatches.append(("klines", record.get("params"), None, params, None))
+        return self._next("klines")
+
+    def remaining(self):
+        return sum(sum(counts.values()) for _, counts in self.leftover)
+
+
+def _jsonable(value):
+    """Normalizes kwargs the same way the capture stored them (str for non-JSON types)."""
+    if isinstance(value, dict):
+        return {k: _jsonable(v) for k, v in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_jsonable(v) for v in value]
+    if value is None or isinstance(value, (str, int, float, bool)):
+        return value
+    return str(value)
+
+
+class ReplayClient:
+    """Stands in for binance Client; every method returns the recorded response."""
+
+    def __init__(self, session):
+        self._session = session
+
+    def __getattr__(self, name):
+        def replayed(*args, **kwargs):
+            return self._session._next(name, args, kwargs)
+        return replayed
+
+
+# ======================
+# Replay Driver
+# ======================
+def install(session):
+    """
+    Points binance_client (and the modules built on it) at the replay session.
+    Call before importing executor_limit so its module-level client is the replay one.
+    """
+    client = ReplayClient(session)
+
+    class ReplayDatetime(datetime):
+        @classmethod
+        def now(cls, tz=None):
+            return datetime.fromtimestamp(session.now, tz)
+
+    class ReplayTime:
+        """The time module, except time() is the recorded tick time."""
+        def __getattr__(self, name):
+            return getattr(time, name)
+
+        def time(self):
+            return session.now
+
+    binance_client._capture = None  # never re-record a replay
+    binance_client.get_binance_client = lambda testnet=binance_client.TESTNET: client
+    binance_client.get_raw_klines = session.get_raw_klines
+
+    import risk_management
+    import executor_limit
+    risk_management.get_binance_client = binance_client.get_binance_client
+    executor_limit.client = client
+    executor_limit.datetime = ReplayDatetime
+    executor_limit.time = ReplayTime()
+    return executor_limit
+
+
+def replay(path, speed=0, log_file=REPLAY_LOG_FILE, profile=False):
+    """
+    Feeds a capture back into execute_strategy_limit, one run per recorded tick.
+    - speed: 1 = real time, 10 = 10x faster, 0 = as fast as possible
+    - log_file: trade log for the replay (keeps trade_log.csv untouched)
+    - profile: print a cProfile summary of the replay
+    """
+    session = ReplaySession(read_capture(path))
+    executor = install(session)
+    executor.LOG_FILE = log_file
+
+    def run():
+        prev_ts = None
+        for number, tick in enumerate(session.ticks):
+            if speed and prev_ts is not None:
+                time.sleep(max(0.0, (tick["ts"] - prev_ts) / speed))
+            prev_ts = tick["ts"]
+            session.begin_tick(number)
+            try:
+                executor.execute_strategy_limit()
+            except ReplayExhausted as e:
+                print(f"✗ Run diverged from the capture: {e}")
+            session.end_tick()
+
+    start = time.time()
+    if profile:
+        profiler = cProfile.Profile()
+        profiler.runcall(run)
+    else:
+        run()
+    elapsed = time.time() - start
+
+    print("\n" + "=" * 60)
+    print("REPLAY SUMMARY")
+    print("=" * 60)
+    print(f"Ticks: {len(session.ticks)}, Responses served: {session.served}, "
+          f"Unused records: {session.remaining()}, Time: {elapsed:.2f}s")
+    if session.skipped:
+        print(f"Skipped {session.skipped} record(s) from other tools/sessions (no executor tick)")
+    for method, count in sorted(session.calls.items()):
+        print(f"  {method}: {count}")
+    if session.mismatches:
+        print(f"⚠ {len(session.mismatches)} request(s) differ from the capture (code diverged):")
+        for method, rec_args, rec_kwargs, args, kwargs in session.mismatches[:10]:
+            print(f"  {method}: recorded {rec_args} {rec_kwargs or ''} -> now {args} {kwargs or ''}")
+    if session.missing:
+        print(f"⚠ {len(session.missing)} request(s) were not in their tick's capture:")
+        for number, method in session.missing[:10]:
+            print(f"  tick {number}: {method}")
+    if session.leftover:
+        print(f"⚠ {len(session.leftover)} tick(s) left recorded responses unused:")
+        for number, counts in session.leftover[:10]:
+            print(f"  tick {number}: {counts}")
+    if not (session.mismatches or session.missing or session.leftover):
+        print("✓ All requests matched the capture.")
+
+    if profile:
+        print("\n" + "=" * 60)
+        print("PROFILE (top 25 by cumulative time)")
+        print("=" * 60)
+        pstats.Stats(profiler).sort_stats("cumulative").print_stats(25)
+
+    return session
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Replay a capture through the limit executor.")
+    parser.add_argument("capture", help="capture file written with BINANCE_CAPTURE_FILE set")
+    parser.add_argument("--speed", type=float, default=0,
+                        help="1 = real time, N = N times faster, 0 = no waiting (default)")
+    parser.add_argument("--log-file", default=REPLAY_LOG_FILE, help="trade log for the replay")
+    parser.add_argument("--profile", action="store_true", help="print cProfile stats")
+    args = parser.parse_args()
+
+    replay(args.capture, speed=args.speed, log_file=args.log_file, profile=args.profile)